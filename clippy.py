@@ -9,22 +9,32 @@ Usage:
 
 import tkinter as tk
 from tkinter import messagebox, simpledialog
-from PIL import Image, ImageTk, ImageSequence, ImageDraw, ImageFont
+from PIL import Image, ImageTk
 import requests
+from requests.adapters import HTTPAdapter
+import io
 import json
+import queue
 import threading
 import subprocess
 import shutil
 import os
 import sys
 import time
+import types
 import math
 import random
 import re
-import glob
-import webbrowser
-import urllib.parse
 import ctypes
+import fnmatch
+import functools
+from collections import deque
+from concurrent.futures import Future
+
+try:
+    import re2  # optional: google-re2, linear-time matching for intent patterns
+except ImportError:
+    re2 = None
 
 
 def _get_virtual_screen_bounds() -> tuple[int, int, int, int]:
@@ -53,10 +63,22 @@ def _get_virtual_screen_bounds() -> tuple[int, int, int, int]:
 # ═══════════════════════════════════════════════════════════════════════════
 
 ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
-SETTINGS_FILE = os.path.join(os.path.expanduser("~"), ".clippy_python_settings.json")
+
+# User folders — resolved once at import instead of on every intent/file search
+_HOME = os.path.expanduser("~")
+_DESKTOP = os.path.join(_HOME, "Desktop")
+_DOCUMENTS = os.path.join(_HOME, "Documents")
+_DOWNLOADS = os.path.join(_HOME, "Downloads")
+_PICTURES = os.path.join(_HOME, "Pictures")
+_MUSIC = os.path.join(_HOME, "Music")
+_VIDEOS = os.path.join(_HOME, "Videos")
+
+SETTINGS_FILE = os.path.join(_HOME, ".clippy_python_settings.json")
 
 DEFAULT_OLLAMA_URL = "http://localhost:11434"
 DEFAULT_MODEL = "llama3.2"
+DEFAULT_MAX_TURNS = 20      # user/assistant exchanges sent to the model as context
+OLLAMA_KEEP_ALIVE = "30m"   # keep the model (and its cached prompt prefix) loaded between turns
 
 SYSTEM_PROMPT = (
     "You are Clippy, the classic Microsoft Office assistant, revived as a modern "
@@ -128,7 +150,7 @@ GREETING = (
 
 # Clippy personality — random things Clippy says when idle
 # Mix of: tips, humor, deep thoughts, and "servicial" helpfulness
-IDLE_TIPS = [
+IDLE_TIPS = (
     # ── Tips ──
     "Tip: Right-click me for options!",
     "Tip: You can drag me anywhere on screen!",
@@ -187,7 +209,7 @@ IDLE_TIPS = [
     "I'm running 100% locally on your machine!",
     "I'm powered by Ollama. Pretty cool, right?",
     "Zero telemetry. Zero tracking. Just you and me.",
-]
+)
 
 # ═══════════════════════════════════════════════════════════════════════════
 #  SETTINGS
@@ -202,6 +224,7 @@ class Settings:
         self.idle_roaming: bool = True
         self.show_tips: bool = True
         self.auto_start_ollama: bool = True
+        self.max_turns: int = DEFAULT_MAX_TURNS
         self.pos_x: int | None = None   # Last saved X position (None = default)
         self.pos_y: int | None = None   # Last saved Y position (None = default)
         self.load()
@@ -217,15 +240,23 @@ class Settings:
                 self.idle_roaming = d.get("idle_roaming", self.idle_roaming)
                 self.show_tips = d.get("show_tips", self.show_tips)
                 self.auto_start_ollama = d.get("auto_start_ollama", self.auto_start_ollama)
+                try:
+                    self.max_turns = int(d.get("max_turns", self.max_turns))
+                except (TypeError, ValueError, OverflowError):
+                    self.max_turns = DEFAULT_MAX_TURNS
                 self.pos_x = d.get("pos_x", self.pos_x)
                 self.pos_y = d.get("pos_y", self.pos_y)
         except Exception:
             pass
 
     def save(self):
+        # Write to a temp file and swap it in, so a crash mid-write can't corrupt settings
         try:
-            with open(SETTINGS_FILE, "w") as f:
-                json.dump(vars(self), f, indent=2)
+            data = json.dumps(vars(self), indent=2)
+            tmp = SETTINGS_FILE + ".tmp"
+            with open(tmp, "w") as f:
+                f.write(data)
+            os.replace(tmp, SETTINGS_FILE)
         except Exception:
             pass
 
@@ -235,21 +266,124 @@ class Settings:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+# One keep-alive connection pool for every call to the local Ollama server
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+
+class _DaemonPool:
+    """Small stand-in for ThreadPoolExecutor whose workers are daemon threads.
+    ThreadPoolExecutor joins its workers at exit, so one busy task would keep
+    the process alive after the window closes; these die with the interpreter."""
+
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        self._max_workers = max_workers
+        self._prefix = thread_name_prefix
+        self._queue = queue.SimpleQueue()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, fn, *args) -> Future:
+        fut = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._queue.put((fut, fn, args))
+            if len(self._threads) < self._max_workers:
+                t = threading.Thread(target=self._work, daemon=True,
+                                     name=f"{self._prefix}_{len(self._threads)}")
+                self._threads.append(t)
+                t.start()
+        return fut
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            fut, fn, args = item
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                fut.set_result(fn(*args))
+            except BaseException as e:
+                fut.set_exception(e)
+
+    def shutdown(self, cancel_futures: bool = False):
+        """Stop accepting work, optionally cancelling queued tasks. Never blocks."""
+        with self._lock:
+            self._closed = True
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        item[0].cancel()
+            for _ in self._threads:
+                self._queue.put(None)
+
+
+# Shared pool for blocking I/O that can run side by side (HTTP probes, folder searches)
+_IO_POOL = _DaemonPool(max_workers=4, thread_name_prefix="clippy-io")
+
+
 class OllamaManager:
     """Handles auto-starting Ollama and checking connectivity."""
 
+    # Last probe() result, shared by callers within PROBE_TTL seconds
+    PROBE_TTL = 2.0
+    _probe_cache = {"t": 0.0, "url": "", "running": False, "models": []}
+
+    # Last successful is_running() check — the server rarely goes away mid-session
+    _running_cache = {"t": 0.0, "url": ""}
+
     @staticmethod
-    def is_running(url: str) -> bool:
+    def is_running(url: str, max_age: float = 5.0) -> bool:
+        """Health-check the server, trusting a success up to max_age seconds old.
+        Failures are never cached, so a freshly started server is seen at once."""
+        url = url.rstrip("/")
+        cache = OllamaManager._running_cache
+        now = time.monotonic()
+        if cache["url"] == url and now - cache["t"] < max_age:
+            return True
         try:
-            r = requests.get(url.rstrip("/"), timeout=3)
-            return r.status_code == 200
+            ok = _SESSION.get(url, timeout=3).status_code == 200
         except Exception:
-            return False
+            ok = False
+        if ok:
+            cache.update(t=now, url=url)
+        else:
+            cache["t"] = 0.0
+        return ok
+
+    @staticmethod
+    def probe(url: str) -> tuple[bool, list[str]]:
+        """Check the server and fetch its model list concurrently.
+        Returns (running, models); results are reused for PROBE_TTL seconds."""
+        url = url.rstrip("/")
+        cache = OllamaManager._probe_cache
+        if cache["url"] == url and time.monotonic() - cache["t"] < OllamaManager.PROBE_TTL:
+            return cache["running"], cache["models"]
+        running = _IO_POOL.submit(OllamaManager.is_running, url, 0)
+        models = _IO_POOL.submit(OllamaManager._fetch_models, url)
+        cache.update(t=time.monotonic(), url=url, running=running.result(), models=models.result())
+        return cache["running"], cache["models"]
+
+    @staticmethod
+    def invalidate():
+        """Forget cached probe results (e.g. after killing the server)."""
+        OllamaManager._probe_cache["t"] = 0.0
+        OllamaManager._running_cache["t"] = 0.0
 
     @staticmethod
     def auto_start(url: str) -> str | None:
         """Try to start Ollama. Returns error message or None on success."""
-        if OllamaManager.is_running(url):
+        running, _ = OllamaManager.probe(url)   # also warms the model list
+        if running:
             return None
 
         ollama_path = shutil.which("ollama")
@@ -277,19 +411,31 @@ class OllamaManager:
                 stderr=subprocess.DEVNULL,
                 creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
             )
-            # Wait for it to come up
-            for _ in range(15):
-                time.sleep(1)
-                if OllamaManager.is_running(url):
+            # Wait for it to come up — poll fast at first, backing off to 500ms
+            deadline = time.monotonic() + 15
+            delay = 0.05
+            while time.monotonic() < deadline:
+                if OllamaManager.is_running(url, max_age=0):
+                    OllamaManager.invalidate()   # drop the "not running, no models" probe
                     return None
+                time.sleep(delay)
+                delay = min(delay * 1.5, 0.5)
             return "⏳ Ollama started but isn't responding yet. Try again in a moment."
         except Exception as e:
             return f"❌ Failed to start Ollama: {e}"
 
     @staticmethod
     def list_models(url: str) -> list[str]:
+        url = url.rstrip("/")
+        cache = OllamaManager._probe_cache
+        if cache["url"] == url and time.monotonic() - cache["t"] < OllamaManager.PROBE_TTL:
+            return cache["models"]
+        return OllamaManager._fetch_models(url)
+
+    @staticmethod
+    def _fetch_models(url: str) -> list[str]:
         try:
-            r = requests.get(f"{url.rstrip('/')}/api/tags", timeout=5)
+            r = _SESSION.get(f"{url.rstrip('/')}/api/tags", timeout=5)
             if r.status_code == 200:
                 return [m["name"] for m in r.json().get("models", [])]
         except Exception:
@@ -303,16 +449,20 @@ class OllamaManager:
 
 
 class OllamaChat:
+    # Sent first on every request; identical each turn so Ollama can reuse its prefix cache
+    SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.messages: list[dict] = [{"role": "system", "content": SYSTEM_PROMPT}]
+        self.messages: list[dict] = []   # user/assistant turns only
 
     def clear(self):
-        self.messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+        self.messages = []
 
     def stream(self, user_text: str, on_chunk, on_done, on_error, cancel: threading.Event,
                on_model_not_found=None):
-        """Send user message and stream response. Call from background thread."""
+        """Send user message and stream response. Call from background thread.
+        on_chunk(delta) gets each piece as it arrives; on_done() fires once the reply is complete."""
         self.messages.append({"role": "user", "content": user_text})
         base = self.settings.ollama_url.rstrip("/")
         model = self.settings.model
@@ -330,11 +480,16 @@ class OllamaChat:
             )
             return
 
-        full = []
+        full = io.StringIO()
         try:
-            resp = requests.post(
+            resp = _SESSION.post(
                 f"{base}/api/chat",
-                json={"model": model, "messages": self.messages, "stream": True},
+                json={
+                    "model": model,
+                    "messages": [self.SYSTEM_MESSAGE, *self.messages],
+                    "stream": True,
+                    "keep_alive": OLLAMA_KEEP_ALIVE,
+                },
                 stream=True, timeout=300,
             )
             if resp.status_code == 404:
@@ -352,26 +507,21 @@ class OllamaChat:
                 on_error(f"❌ Ollama HTTP {resp.status_code}\n{resp.text[:300]}")
                 return
 
-            for line in resp.iter_lines():
+            for data in self._iter_ndjson(resp):
                 if cancel.is_set():
                     break
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
                 if "error" in data:
                     on_error(f"❌ {data['error']}")
                     return
                 content = data.get("message", {}).get("content", "")
                 if content:
-                    full.append(content)
+                    full.write(content)
                     on_chunk(content)
                 if data.get("done"):
                     break
 
         except requests.ConnectionError:
+            OllamaManager.invalidate()
             on_error("❌ Lost connection to Ollama.")
             return
         except requests.Timeout:
@@ -381,22 +531,89 @@ class OllamaChat:
             on_error(f"❌ {e}")
             return
 
-        text = "".join(full)
+        text = full.getvalue()
         if text:
             self.messages.append({"role": "assistant", "content": text})
+            self._trim_history()
         on_done()
 
+    def _trim_history(self):
+        """Keep only the last max_turns exchanges so prompt size stays bounded."""
+        limit = 2 * max(1, self.settings.max_turns)
+        if len(self.messages) > limit:
+            del self.messages[:-limit]
+            # Never start the window on an assistant reply whose question was dropped
+            while self.messages and self.messages[0]["role"] != "user":
+                self.messages.pop(0)
+
+    @staticmethod
+    def _iter_ndjson(resp):
+        """Yield JSON objects from a streamed NDJSON response.
+        Lines are split on the raw bytes as they arrive and parsed without an extra decode step."""
+        buf = bytearray()
+        for chunk in resp.iter_content(chunk_size=None):
+            buf += chunk
+            start = 0
+            while (nl := buf.find(b"\n", start)) >= 0:
+                line = buf[start:nl]
+                start = nl + 1
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+            del buf[:start]
+        # Final line without a trailing newline
+        if buf.strip():
+            try:
+                yield json.loads(buf)
+            except json.JSONDecodeError:
+                pass
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 #  ACTION EXECUTOR
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+# Win32 SendInput structures (used by ActionExecutor._type_text)
+_INPUT_KEYBOARD = 1
+_KEYEVENTF_KEYUP = 0x0002
+_KEYEVENTF_UNICODE = 0x0004
+_VK_RETURN = 0x0D
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [("wVk", ctypes.c_ushort), ("wScan", ctypes.c_ushort), ("dwFlags", ctypes.c_ulong),
+                ("time", ctypes.c_ulong), ("dwExtraInfo", ctypes.c_size_t)]
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [("dx", ctypes.c_long), ("dy", ctypes.c_long), ("mouseData", ctypes.c_ulong),
+                ("dwFlags", ctypes.c_ulong), ("time", ctypes.c_ulong), ("dwExtraInfo", ctypes.c_size_t)]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT)]
+
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_ulong), ("u", _INPUTUNION)]
+
+
+def _key_input(vk: int = 0, scan: int = 0, flags: int = 0) -> _INPUT:
+    return _INPUT(type=_INPUT_KEYBOARD, u=_INPUTUNION(ki=_KEYBDINPUT(wVk=vk, wScan=scan, dwFlags=flags)))
+
+
+# PATH lookups are stable for the session — cache them
+_which = functools.lru_cache(maxsize=256)(shutil.which)
+
+
 class ActionExecutor:
     """Executes action commands parsed from Clippy's responses."""
 
-    # Map friendly app names → executable names / commands
-    APP_MAP = {
+    # Map friendly app names → executable names / commands (read-only, interned keys)
+    APP_MAP = types.MappingProxyType({sys.intern(k): v for k, v in {
         "chrome": "chrome",
         "google chrome": "chrome",
         "firefox": "firefox",
@@ -430,7 +647,7 @@ class ActionExecutor:
         "control panel": "control",
         "settings": "ms-settings:",
         "snipping tool": "snippingtool",
-    }
+    }.items()})
 
     @staticmethod
     def run(cmd: str, arg: str) -> str | None:
@@ -463,12 +680,13 @@ class ActionExecutor:
     def _open_url(url: str) -> str:
         if not url.startswith(("http://", "https://")):
             url = "https://" + url
+        import webbrowser
         webbrowser.open(url)
         return f"🌐 Opened: {url}"
 
     @staticmethod
     def _open_app(name: str) -> str:
-        name_lower = name.lower().strip()
+        name_lower = sys.intern(name.lower().strip())
         exe = ActionExecutor.APP_MAP.get(name_lower, name_lower)
 
         # Handle ms-settings: URI
@@ -477,32 +695,7 @@ class ActionExecutor:
             return f"🚀 Opened: {name}"
 
         # Try to find and launch
-        found = shutil.which(exe)
-        if not found:
-            found = shutil.which(exe + ".exe")
-        if not found:
-            # Try common paths
-            for base_dir in [
-                os.environ.get("PROGRAMFILES", ""),
-                os.environ.get("PROGRAMFILES(X86)", ""),
-                os.environ.get("LOCALAPPDATA", ""),
-            ]:
-                if not base_dir:
-                    continue
-                for root_dir, dirs, files in os.walk(base_dir):
-                    for f in files:
-                        if f.lower() in (exe + ".exe", exe):
-                            found = os.path.join(root_dir, f)
-                            break
-                    if found:
-                        break
-                    # Only walk 2 levels deep to avoid taking forever
-                    depth = root_dir.replace(base_dir, "").count(os.sep)
-                    if depth >= 2:
-                        dirs.clear()
-                if found:
-                    break
-
+        found = ActionExecutor._resolve_exe(exe)
         if found:
             subprocess.Popen(
                 [found],
@@ -519,8 +712,50 @@ class ActionExecutor:
         except Exception:
             return f"❌ Couldn't find '{name}'. Is it installed?"
 
-    # Map app names → process names for killing
-    KILL_MAP = {
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _resolve_exe(exe: str) -> str | None:
+        """Locate an executable on PATH or under Program Files. Cached per session,
+        so repeat launches of the same app skip the filesystem search."""
+        found = _which(exe) or _which(exe + ".exe")
+        if found:
+            return found
+        targets = {exe + ".exe", exe}
+        for base_dir in [
+            os.environ.get("PROGRAMFILES", ""),
+            os.environ.get("PROGRAMFILES(X86)", ""),
+            os.environ.get("LOCALAPPDATA", ""),
+        ]:
+            if not base_dir:
+                continue
+            found = ActionExecutor._scandir_find(base_dir, targets)
+            if found:
+                return found
+        return None
+
+    @staticmethod
+    def _scandir_find(base_dir: str, target_names: set[str], max_depth: int = 2) -> str | None:
+        """Breadth-first search for a file whose lowercased name is in target_names.
+        Only descends max_depth levels to avoid taking forever on Program Files."""
+        queue = deque([(base_dir, 0)])
+        while queue:
+            path, depth = queue.popleft()
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if entry.is_symlink():
+                            continue
+                        if entry.is_file():
+                            if entry.name.lower() in target_names:
+                                return entry.path
+                        elif depth < max_depth and entry.is_dir():
+                            queue.append((entry.path, depth + 1))
+            except OSError:  # PermissionError, vanished dirs, etc.
+                pass
+        return None
+
+    # Map app names → process names for killing (read-only, interned keys)
+    KILL_MAP = types.MappingProxyType({sys.intern(k): v for k, v in {
         "chrome": ["chrome", "chrome.exe"],
         "google chrome": ["chrome", "chrome.exe"],
         "firefox": ["firefox", "firefox.exe"],
@@ -548,44 +783,96 @@ class ActionExecutor:
         "powershell": ["powershell", "powershell.exe"],
         "explorer": ["explorer", "explorer.exe"],
         "task manager": ["taskmgr", "taskmgr.exe"],
-    }
+    }.items()})
 
     @staticmethod
     def _close_app(name: str) -> str:
         """Close an application by killing its process."""
-        name_lower = name.lower().strip()
+        name_lower = sys.intern(name.lower().strip())
         process_names = ActionExecutor.KILL_MAP.get(name_lower)
         if not process_names:
             # Try generic: just use the name as process
             process_names = [name_lower, name_lower + ".exe"]
 
-        killed = False
-        for proc in process_names:
-            try:
-                result = subprocess.run(
-                    ["taskkill", "/f", "/im", proc if proc.endswith(".exe") else proc + ".exe"],
-                    capture_output=True, text=True, timeout=5,
-                    creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-                )
-                if result.returncode == 0:
-                    killed = True
-                    break
-            except Exception:
-                continue
+        image_names = [p if p.endswith(".exe") else p + ".exe" for p in process_names]
+        try:
+            killed = ActionExecutor._kill_by_names(image_names)
+        except Exception:
+            killed = False
         if killed:
             return f"✅ Closed: {name}"
         return f"⚠️ Couldn't find '{name}' running."
 
+    @staticmethod
+    def _kill_by_names(image_names: list[str]) -> bool:
+        """Terminate processes in-process via Win32 (no taskkill.exe per name).
+        Like trying `taskkill /f /im` for each name in order: every process with the
+        first name that has a running match is killed. Returns True if any was."""
+        PROCESS_TERMINATE = 0x0001
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        kernel32 = ctypes.windll.kernel32
+        psapi = ctypes.windll.psapi
+        kernel32.OpenProcess.restype = ctypes.c_void_p
+        kernel32.OpenProcess.argtypes = [ctypes.c_ulong, ctypes.c_int, ctypes.c_ulong]
+        kernel32.QueryFullProcessImageNameW.argtypes = [
+            ctypes.c_void_p, ctypes.c_ulong, ctypes.c_wchar_p, ctypes.POINTER(ctypes.c_ulong)]
+        kernel32.TerminateProcess.argtypes = [ctypes.c_void_p, ctypes.c_uint]
+        kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+
+        # Enumerate PIDs, growing the buffer until it has room to spare
+        size = 1024
+        while True:
+            pids = (ctypes.c_ulong * size)()
+            needed = ctypes.c_ulong()
+            if not psapi.EnumProcesses(pids, ctypes.sizeof(pids), ctypes.byref(needed)):
+                return False
+            if needed.value < ctypes.sizeof(pids):
+                break
+            size *= 2
+        count = needed.value // ctypes.sizeof(ctypes.c_ulong)
+
+        wanted = [n.lower() for n in image_names]
+        handles: dict[str, list[int]] = {}
+        buf = ctypes.create_unicode_buffer(260)
+        for pid in pids[:count]:
+            h = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION | PROCESS_TERMINATE, False, pid)
+            if not h:
+                continue
+            length = ctypes.c_ulong(len(buf))
+            if kernel32.QueryFullProcessImageNameW(h, 0, buf, ctypes.byref(length)):
+                exe = os.path.basename(buf.value).lower()
+                if exe in wanted:
+                    handles.setdefault(exe, []).append(h)
+                    continue
+            kernel32.CloseHandle(h)
+
+        killed = False
+        try:
+            for exe in wanted:
+                for h in handles.get(exe, ()):
+                    if kernel32.TerminateProcess(h, 1):
+                        killed = True
+                if killed:
+                    break
+        finally:
+            for hs in handles.values():
+                for h in hs:
+                    kernel32.CloseHandle(h)
+        return killed
+
     @staticmethod
     def _search_web(query: str) -> str:
         import urllib.parse
+        import webbrowser
         url = f"https://www.google.com/search?q={urllib.parse.quote_plus(query)}"
         webbrowser.open(url)
         return f"🔍 Searched: {query}"
 
     @staticmethod
     def _open_folder(path: str) -> str:
-        path = os.path.expanduser(path.replace("/", "\\"))
+        path = path.replace("/", "\\")
+        if path.startswith("~"):
+            path = os.path.expanduser(path)
         if not os.path.exists(path):
             return f"❌ Folder not found: {path}"
         os.startfile(path)
@@ -593,19 +880,16 @@ class ActionExecutor:
 
     @staticmethod
     def _find_file(pattern: str) -> str:
-        home = os.path.expanduser("~")
-        search_dirs = [
-            os.path.join(home, "Desktop"),
-            os.path.join(home, "Documents"),
-            os.path.join(home, "Downloads"),
-        ]
+        search_dirs = [d for d in (_DESKTOP, _DOCUMENTS, _DOWNLOADS) if os.path.exists(d)]
+        # Search all folders in parallel; collect in folder order so output is stable
+        futures = [_IO_POOL.submit(ActionExecutor._scan_match, d, pattern) for d in search_dirs]
         results = []
-        for d in search_dirs:
-            if os.path.exists(d):
-                found = glob.glob(os.path.join(d, "**", pattern), recursive=True)
-                results.extend(found[:20])
+        for fut in futures:
+            results.extend(fut.result())
             if len(results) >= 30:
                 break
+        for fut in futures:
+            fut.cancel()
 
         if not results:
             return f"🔍 No files matching '{pattern}' found in Desktop, Documents, or Downloads."
@@ -620,14 +904,39 @@ class ActionExecutor:
             text += f"\n  ... and {len(results) - 10} more."
         return text
 
+    @staticmethod
+    def _scan_match(root: str, pattern: str, limit: int = 20) -> list[str]:
+        """Recursively collect up to `limit` files under root whose name matches pattern
+        (case-insensitive). Skips symlinks and hidden entries, like glob does."""
+        out = []
+        stack = [root]
+        pat = pattern.lower()
+        while stack and len(out) < limit:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        name = entry.name
+                        if name.startswith(".") or entry.is_symlink():
+                            continue
+                        if entry.is_file():
+                            if fnmatch.fnmatchcase(name.lower(), pat):
+                                out.append(entry.path)
+                                if len(out) >= limit:
+                                    break
+                        elif entry.is_dir():
+                            stack.append(entry.path)
+            except OSError:
+                pass
+        return out
+
+    # Safety: commands SYSTEM_CMD refuses to run (matched anywhere, case-insensitive)
+    _DANGEROUS_RE = re.compile(r'format|del\s+/|rm\s+-rf|rmdir|rd\s+/s|:\(\)\{|shutdown|restart')
+
     @staticmethod
     def _system_cmd(command: str) -> str:
         # Safety: block dangerous commands
-        dangerous = ["format", "del /", "rm -rf", "rmdir", "rd /s", ":(){", "shutdown", "restart"]
-        cmd_lower = command.lower()
-        for d in dangerous:
-            if d in cmd_lower:
-                return f"🚫 Blocked potentially dangerous command: {command}"
+        if ActionExecutor._DANGEROUS_RE.search(command.lower()):
+            return f"🚫 Blocked potentially dangerous command: {command}"
 
         try:
             result = subprocess.run(
@@ -649,9 +958,8 @@ class ActionExecutor:
         try:
             from PIL import ImageGrab
             img = ImageGrab.grab()
-            desktop = os.path.join(os.path.expanduser("~"), "Desktop")
             ts = time.strftime("%Y%m%d_%H%M%S")
-            path = os.path.join(desktop, f"clippy_screenshot_{ts}.png")
+            path = os.path.join(_DESKTOP, f"clippy_screenshot_{ts}.png")
             img.save(path)
             return f"📸 Screenshot saved: {path}"
         except ImportError:
@@ -661,16 +969,21 @@ class ActionExecutor:
 
     @staticmethod
     def _type_text(text: str) -> str:
-        """Simulate typing using PowerShell SendKeys (Windows)."""
+        """Simulate typing with Win32 SendInput (Unicode key events, no subprocess)."""
         try:
-            ps_text = text.replace("'", "''")
-            subprocess.run(
-                ["powershell", "-Command",
-                 f"Add-Type -AssemblyName System.Windows.Forms; "
-                 f"[System.Windows.Forms.SendKeys]::SendWait('{ps_text}')"],
-                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-                timeout=5,
-            )
+            events = []
+            # One UTF-16 code unit per event, so characters outside the BMP go as surrogate pairs
+            for unit in memoryview(text.replace("\r\n", "\n").encode("utf-16-le")).cast("H"):
+                if unit == 0x0A:   # newline → Enter
+                    events += [_key_input(vk=_VK_RETURN), _key_input(vk=_VK_RETURN, flags=_KEYEVENTF_KEYUP)]
+                else:
+                    events += [_key_input(scan=unit, flags=_KEYEVENTF_UNICODE),
+                               _key_input(scan=unit, flags=_KEYEVENTF_UNICODE | _KEYEVENTF_KEYUP)]
+            if events:
+                sent = ctypes.windll.user32.SendInput(
+                    len(events), (_INPUT * len(events))(*events), ctypes.sizeof(_INPUT))
+                if sent != len(events):
+                    return "❌ Type failed: input was blocked."
             return f"⌨️ Typed text."
         except Exception as e:
             return f"❌ Type failed: {e}"
@@ -681,6 +994,43 @@ class ActionExecutor:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+def _build_app_lookup(apps) -> tuple[dict[str, str], int]:
+    """Map each whole app name, keyed by its space-joined words, to the canonical name.
+    Also returns the longest name in words, bounding the window scan in detect()."""
+    lookup = {" ".join(app.split()): app for app in apps}
+    return lookup, max(len(name.split()) for name in lookup)
+
+
+def _build_open_targets(sites, folders, apps) -> dict[str, tuple[str, str]]:
+    """Map every known site/folder/app name to the action that opens it.
+    When a name is in several tables, sites win over folders and folders over apps."""
+    targets = {}
+    for name, url in sites.items():
+        targets.setdefault(sys.intern(name.lower()), ("OPEN_URL", url))
+    for name, path in folders.items():
+        targets.setdefault(sys.intern(name.lower()), ("OPEN_FOLDER", path))
+    for name in apps:
+        name = sys.intern(name.lower())
+        targets.setdefault(name, ("OPEN_APP", name))
+    return targets
+
+
+def _compile_intent(pattern: str):
+    """Compile with re2 when it is installed and supports the pattern, else with re."""
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+
+def _name_alternation(names):
+    """Compile a whole-word, longest-first alternation that finds any of names."""
+    alts = "|".join(map(re.escape, sorted(names, key=len, reverse=True)))
+    return _compile_intent(rf"\b(?:{alts})\b")
+
+
 class IntentDetector:
     """Detects user intents directly from their message text.
     This fires actions immediately without waiting for the LLM."""
@@ -721,54 +1071,99 @@ class IntentDetector:
         "task manager", "control panel", "settings",
         "snipping tool", "whatsapp",
     }
+    _APP_LOOKUP, _APP_MAX_WORDS = _build_app_lookup(APPS)
+    # Lowercased, interned and in a fixed order for the partial-name fallback
+    _APP_NAMES = tuple(sorted(sys.intern(app.lower()) for app in APPS))
 
     # Folder shortcuts
     FOLDERS = {
-        "desktop":   os.path.join(os.path.expanduser("~"), "Desktop"),
-        "documents": os.path.join(os.path.expanduser("~"), "Documents"),
-        "downloads": os.path.join(os.path.expanduser("~"), "Downloads"),
-        "pictures":  os.path.join(os.path.expanduser("~"), "Pictures"),
-        "music":     os.path.join(os.path.expanduser("~"), "Music"),
-        "videos":    os.path.join(os.path.expanduser("~"), "Videos"),
-        "home":      os.path.expanduser("~"),
+        "desktop":   _DESKTOP,
+        "documents": _DOCUMENTS,
+        "downloads": _DOWNLOADS,
+        "pictures":  _PICTURES,
+        "music":     _MUSIC,
+        "videos":    _VIDEOS,
+        "home":      _HOME,
     }
 
+    # Exact open targets, plus one whole-word alternation per table. The tables are
+    # searched sites → folders → apps, so a site named late in the command still
+    # beats an app named early ("open chrome to youtube" → YouTube)
+    _OPEN_TARGETS = _build_open_targets(SITES, FOLDERS, APPS)
+    _SITE_RE = _name_alternation(SITES)
+    _FOLDER_RE = _name_alternation(FOLDERS)
+    _APP_RE = _name_alternation(APPS)
+
+    # Close / screenshot / search intents, combined so the message is matched in
+    # one pass. Alternatives are tried in priority order; dispatch on lastgroup.
+    # The screenshot lookahead is not RE2 syntax, so this one stays on re.
+    _RE_INTENT = re.compile(
+        r'(?P<close>(?:close|kill|exit|quit|stop|terminate|end|cierra|cerrar)\s+(?:the\s+)?(?:my\s+)?(?P<close_target>.+))'
+        r'|(?P<screenshot>(?=.*\b(?:take|capture|grab|do)\b.*\b(?:screenshot|screen\s*shot|screen\s*cap|captura)\b|.*\bscreenshot\b))'
+        r'|(?P<search>(?:google|search|search\s+for|look\s+up|busca|buscar)\s+(?P<search_query>.+))'
+    )
+
+    # Find / open intents and their helpers
+    _FIND_RE = _compile_intent(r'(?:find|search|look\s+for|busca)\s+(?:my\s+)?(?:files?\s+)?(?:called\s+|named\s+)?(.+?)(?:\s+files?)?(?:\s+on\s+.+)?$')
+    _NAV_RE = _compile_intent(r'\b(open|launch|go|navigate)\b')
+    _EXT_RE = _compile_intent(r'\b(pdf|txt|doc|xls|ppt|jpg|png|mp3|mp4|zip|exe)\b')
+    _OPEN_VERBS = frozenset({"open", "launch", "start", "run", "abre", "abrir"})
+    _GOTO_RE = _compile_intent(r'(?:go|navigate)\s+to\s+(.+)')
+    _URL_RE = _compile_intent(r'https?://|www\.')
+
+    @staticmethod
+    def _match_app(target: str) -> str | None:
+        """Return the longest known app name that appears as whole words in target."""
+        words = target.split()
+        lookup = IntentDetector._APP_LOOKUP
+        for n in range(min(IntentDetector._APP_MAX_WORDS, len(words)), 0, -1):
+            for i in range(len(words) - n + 1):
+                app_name = lookup.get(" ".join(words[i:i + n]))
+                if app_name:
+                    return app_name
+        return None
+
+    @staticmethod
+    def _partial_app(target: str) -> str | None:
+        """Return the first app name (in sorted order) that contains target ("calcul" → calculator)."""
+        return next((app for app in IntentDetector._APP_NAMES if target in app), None)
+
     @staticmethod
     def detect(text: str) -> list[tuple[str, str]]:
         """Parse user text and return list of (action_cmd, action_arg) tuples."""
         actions = []
         lower = text.lower().strip()
 
+        m = IntentDetector._RE_INTENT.match(lower)
+        kind = m.lastgroup if m else None
+
         # ── Close app: "close chrome", "kill notepad", "exit spotify" ──
-        m = re.match(r'(?:close|kill|exit|quit|stop|terminate|end|cierra|cerrar)\s+(?:the\s+)?(?:my\s+)?(.+)', lower)
-        if m:
-            target = m.group(1).strip().rstrip('.')
-            # Check known apps
-            for app_name in IntentDetector.APPS:
-                if app_name in target or target in app_name:
-                    actions.append(("CLOSE_APP", app_name))
-                    return actions
+        if kind == "close":
+            target = m.group("close_target").strip().rstrip('.')
+            # Check known apps — longest whole name in the target, else a partial name
+            app_name = IntentDetector._match_app(target) or IntentDetector._partial_app(target)
+            if app_name:
+                actions.append(("CLOSE_APP", app_name))
+                return actions
             # Fallback: try the raw name
             actions.append(("CLOSE_APP", target))
             return actions
 
         # ── Screenshot ──
-        if re.search(r'\b(take|capture|grab|do)\b.*\b(screenshot|screen\s*shot|screen\s*cap|captura)\b', lower) or \
-           re.search(r'\bscreenshot\b', lower):
+        if kind == "screenshot":
             actions.append(("SCREENSHOT", ""))
             return actions
 
         # ── Search the web: "google X", "search for X", "busca X" ──
-        m = re.match(r'(?:google|search|search\s+for|look\s+up|busca|buscar)\s+(.+)', lower)
-        if m:
-            actions.append(("SEARCH_WEB", m.group(1).strip()))
+        if kind == "search":
+            actions.append(("SEARCH_WEB", m.group("search_query").strip()))
             return actions
 
         # ── Find files: "find pdf files", "find *.txt" ──
-        m = re.match(r'(?:find|search|look\s+for|busca)\s+(?:my\s+)?(?:files?\s+)?(?:called\s+|named\s+)?(.+?)(?:\s+files?)?(?:\s+on\s+.+)?$', lower)
-        if m and not re.search(r'\b(open|launch|go|navigate)\b', lower):
+        m = IntentDetector._FIND_RE.match(lower)
+        if m and not IntentDetector._NAV_RE.search(lower):
             pattern = m.group(1).strip()
-            if any(c in pattern for c in ['*', '.', '?']) or re.search(r'\b(pdf|txt|doc|xls|ppt|jpg|png|mp3|mp4|zip|exe)\b', pattern):
+            if any(c in pattern for c in ['*', '.', '?']) or IntentDetector._EXT_RE.search(pattern):
                 # Looks like a file search
                 if '*' not in pattern and '.' not in pattern:
                     pattern = f"*.{pattern}"  # "find pdf" → "*.pdf"
@@ -776,43 +1171,49 @@ class IntentDetector:
                 return actions
 
         # ── Open something: "open X", "launch X", "start X", "abre X" ──
-        m = re.match(r'(?:open|launch|start|run|go\s+to|navigate\s+to|abre|abrir)\s+(?:the\s+)?(?:my\s+)?(.+)', lower)
-        if m:
-            target = m.group(1).strip().rstrip('.')
+        target = IntentDetector._open_target(lower)
+        if target:
+            target = target.strip().rstrip('.')
 
             # Check for URL
-            if re.match(r'https?://', target) or re.match(r'www\.', target):
+            if IntentDetector._URL_RE.match(target):
                 actions.append(("OPEN_URL", target))
                 return actions
 
-            # Check known websites
-            # Sort by length descending to match "google calendar" before "google"
-            msg_sites = sorted(IntentDetector.SITES.items(), key=lambda x: len(x[0]), reverse=True)
-            for site_name, site_url in msg_sites:
-                if site_name in target:
-                    actions.append(("OPEN_URL", site_url))
-                    return actions
+            # Exact name ("open youtube") — one hash lookup
+            found = IntentDetector._OPEN_TARGETS.get(target)
+            if found:
+                actions.append(found)
+                return actions
 
-            # Check known folders
-            for folder_name, folder_path in IntentDetector.FOLDERS.items():
-                if folder_name in target:
-                    actions.append(("OPEN_FOLDER", folder_path))
-                    return actions
+            # Check known websites, then folders — one scan per table
+            hit = IntentDetector._SITE_RE.search(target)
+            if hit:
+                actions.append(("OPEN_URL", IntentDetector.SITES[hit.group()]))
+                return actions
+            hit = IntentDetector._FOLDER_RE.search(target)
+            if hit:
+                actions.append(("OPEN_FOLDER", IntentDetector.FOLDERS[hit.group()]))
+                return actions
 
             # Check if it looks like a path
             if '\\' in target or '/' in target or ':' in target:
-                expanded = os.path.expanduser(target)
+                expanded = os.path.expanduser(target) if target.startswith("~") else target
                 if os.path.exists(expanded):
                     actions.append(("OPEN_FOLDER", expanded))
                 else:
                     actions.append(("OPEN_APP", target))
                 return actions
 
-            # Check known apps
-            for app_name in IntentDetector.APPS:
-                if app_name in target or target in app_name:
-                    actions.append(("OPEN_APP", app_name))
-                    return actions
+            # Known app, or a partial app name ("calcul" → calculator)
+            hit = IntentDetector._APP_RE.search(target)
+            if hit:
+                actions.append(("OPEN_APP", hit.group()))
+                return actions
+            app_name = IntentDetector._partial_app(target)
+            if app_name:
+                actions.append(("OPEN_APP", app_name))
+                return actions
 
             # Fallback: try as app name anyway
             actions.append(("OPEN_APP", target))
@@ -820,6 +1221,23 @@ class IntentDetector:
 
         return actions
 
+    @staticmethod
+    def _open_target(lower: str) -> str | None:
+        """Return what follows an open verb (or "go to"/"navigate to"), minus a leading "the"/"my"."""
+        parts = lower.split(None, 1)
+        if len(parts) == 2 and parts[0] in IntentDetector._OPEN_VERBS:
+            target = parts[1]
+        else:
+            m = IntentDetector._GOTO_RE.match(lower)
+            if not m:
+                return None
+            target = m.group(1)
+        for article in ("the", "my"):
+            parts = target.split(None, 1)
+            if len(parts) == 2 and parts[0] == article:
+                target = parts[1]
+        return target
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 #  ANIMATED GIF SPRITE
@@ -830,33 +1248,76 @@ class AnimatedSprite:
     """Loads a GIF or static image and provides frame-by-frame animation."""
 
     def __init__(self, path: str, size: tuple[int, int] = (130, 130)):
-        self.frames: list[ImageTk.PhotoImage] = []
-        self.durations: list[int] = []
+        self.frames: list[ImageTk.PhotoImage | None] = []
+        self.durations: tuple[int, ...] = ()
+        self._n = 0
         self.current = 0
         self.size = size
+        self._raw = bytearray()
         self._load(path)
 
     def _load(self, path: str):
-        img = Image.open(path)
-        if hasattr(img, "n_frames") and img.n_frames > 1:
-            for frame in ImageSequence.Iterator(img):
-                f = frame.copy().convert("RGBA").resize(self.size, Image.LANCZOS)
-                self.frames.append(ImageTk.PhotoImage(f))
-                dur = frame.info.get("duration", 100)
-                self.durations.append(max(dur, 30))
-        else:
-            img = img.convert("RGBA").resize(self.size, Image.LANCZOS)
-            self.frames.append(ImageTk.PhotoImage(img))
-            self.durations.append(100)
+        """Decode every frame into one contiguous RGBA buffer.
+
+        PhotoImages are only built the first time a frame is shown.
+        """
+        stride = self.size[0] * self.size[1] * 4
+        durations = []
+        with Image.open(path) as img:
+            n = getattr(img, "n_frames", 1)
+            self._raw = bytearray(stride * n)
+            for i in range(n):
+                # seek() decodes in place, so only one source frame is alive at a time
+                img.seek(i)
+                f = self._fit(img)
+                self._raw[i * stride:(i + 1) * stride] = f.tobytes()
+                del f
+                if n > 1:
+                    durations.append(max(img.info.get("duration", 100), 30))
+                else:
+                    durations.append(100)
+        self.durations = tuple(durations)
+        self._n = len(durations)
+        self.frames = [None] * self._n
+
+    @classmethod
+    def from_static(cls, photo: ImageTk.PhotoImage, size: tuple[int, int]) -> "AnimatedSprite":
+        """Wrap an already-built single image as a (non-animated) sprite."""
+        s = cls.__new__(cls)
+        s.frames = [photo]
+        s.durations = (100,)
+        s._n = 1
+        s.current = 0
+        s.size = size
+        s._raw = bytearray()
+        return s
+
+    def _fit(self, frame: Image.Image) -> Image.Image:
+        """Convert to RGBA at sprite size; LANCZOS only for large down-scales."""
+        frame = frame.convert("RGBA")
+        if frame.size == self.size:
+            return frame
+        w, h = self.size
+        ratio = max(frame.width / w, frame.height / h)
+        return frame.resize(self.size, Image.BILINEAR if ratio < 2.0 else Image.LANCZOS)
+
+    def _frame(self, i: int) -> ImageTk.PhotoImage:
+        photo = self.frames[i]
+        if photo is None:
+            stride = self.size[0] * self.size[1] * 4
+            view = memoryview(self._raw)[i * stride:(i + 1) * stride]
+            img = Image.frombuffer("RGBA", self.size, view, "raw", "RGBA", 0, 1)
+            photo = self.frames[i] = ImageTk.PhotoImage(img)
+        return photo
 
     @property
     def is_animated(self) -> bool:
-        return len(self.frames) > 1
+        return self._n > 1
 
     def next_frame(self) -> tuple[ImageTk.PhotoImage, int]:
-        frame = self.frames[self.current]
+        frame = self._frame(self.current)
         dur = self.durations[self.current]
-        self.current = (self.current + 1) % len(self.frames)
+        self.current = (self.current + 1) % self._n
         return frame, dur
 
     def reset(self):
@@ -864,7 +1325,7 @@ class AnimatedSprite:
 
     @property
     def first(self) -> ImageTk.PhotoImage:
-        return self.frames[0]
+        return self._frame(0)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -879,7 +1340,9 @@ class SpeechBubble:
         self.parent = parent
         self.top = None
         self._hide_job = None
-        self._follow_job = None
+        self._bh = 0  # bubble height; fixed once its text is laid out
+        # Follow Clippy whenever its window moves
+        parent.bind("<Configure>", self._on_parent_configure, add="+")
 
     def show(self, text: str, duration_ms: int = 4000):
         self.hide()
@@ -897,12 +1360,11 @@ class SpeechBubble:
                        padx=10, pady=8)
         lbl.pack()
 
-        # Position above Clippy
+        # Lay out once to learn the height, then position above Clippy
+        self.parent.update_idletasks()
+        self._bh = self.top.winfo_reqheight()
         self._update_position()
 
-        # Continuously follow Clippy while bubble is visible
-        self._start_following()
-
         if duration_ms > 0:
             self._hide_job = self.parent.after(duration_ms, self.hide)
 
@@ -911,28 +1373,18 @@ class SpeechBubble:
         if not self.top:
             return
         try:
-            self.parent.update_idletasks()
             px = self.parent.winfo_x()
             py = self.parent.winfo_y()
-            self.top.update_idletasks()
-            bh = self.top.winfo_reqheight()
-            self.top.geometry(f"+{px + 20}+{py - bh - 10}")
+            self.top.geometry(f"+{px + 20}+{py - self._bh - 10}")
         except Exception:
             pass
 
-    def _start_following(self):
-        """Periodically update bubble position to follow Clippy."""
-        if self._follow_job:
-            self.parent.after_cancel(self._follow_job)
-            self._follow_job = None
-        if self.top:
+    def _on_parent_configure(self, event):
+        """Reposition when Clippy's root window (not a child) is configured."""
+        if self.top and event.widget is self.parent:
             self._update_position()
-            self._follow_job = self.parent.after(50, self._start_following)
 
     def hide(self):
-        if self._follow_job:
-            self.parent.after_cancel(self._follow_job)
-            self._follow_job = None
         if self._hide_job:
             self.parent.after_cancel(self._hide_job)
             self._hide_job = None
@@ -949,6 +1401,59 @@ class SpeechBubble:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+class _ActionTagScanner:
+    """Pulls [ACTION:...] tags out of a reply as it streams in.
+
+    feed() returns the visible text and any tags closed by the chunk; a
+    tag (or a partial "[ACTION:" prefix) split across chunks is held back
+    until it completes.
+    """
+
+    OPEN = "[ACTION:"
+
+    def __init__(self):
+        self._pending = ""
+
+    def feed(self, chunk: str) -> tuple[str, list[str]]:
+        # Most chunks carry no tag at all: one C-level scan and done
+        if not self._pending and "[" not in chunk:
+            return chunk, []
+        buf = self._pending + chunk
+        out: list[str] = []
+        tags: list[str] = []
+        pos = 0
+        while True:
+            start = buf.find(self.OPEN, pos)
+            if start < 0:
+                keep = self._partial_open(buf, pos)
+                out.append(buf[pos:len(buf) - keep])
+                self._pending = buf[len(buf) - keep:]
+                break
+            out.append(buf[pos:start])
+            end = buf.find("]", start + len(self.OPEN))
+            if end < 0:
+                self._pending = buf[start:]
+                break
+            tag = buf[start + len(self.OPEN):end]
+            if tag:
+                tags.append(tag)
+            pos = end + 1
+        return "".join(out), tags
+
+    def flush(self) -> str:
+        """Return whatever is still held back (an unterminated tag)."""
+        tail, self._pending = self._pending, ""
+        return tail
+
+    @classmethod
+    def _partial_open(cls, buf: str, pos: int) -> int:
+        """Length of a trailing prefix of OPEN in buf[pos:], else 0."""
+        i = buf.rfind("[", pos)
+        if i >= 0 and cls.OPEN.startswith(buf[i:]):
+            return len(buf) - i
+        return 0
+
+
 class ChatWindow:
     """The main chat window that opens when you interact with Clippy."""
 
@@ -964,15 +1469,29 @@ class ChatWindow:
     ACCENT   = "#c8a951"   # matte gold
     BORDER   = "#b8a88a"   # warm tan border
 
+    # Bubble kind → (bg, fg, prefix); each kind is also a tag on the message Text
+    _BUBBLE_STYLE = {
+        "user":   (USER_BG, FG, ""),
+        "bot":    (BOT_BG, FG, "📎  "),
+        "error":  (ERR_BG, "#b71c1c", ""),
+        "action": (ACTION_BG, "#2e7d32", "✓  "),
+    }
+
     def __init__(self, parent_app: "ClippyApp"):
         self.app = parent_app
         self.top: tk.Toplevel | None = None
         self.is_open = False
         self.is_streaming = False
         self.cancel_event = threading.Event()
-        self._bot_label: tk.Label | None = None
+        self._bot_open = False  # a bot reply is tracked by the bot_* text marks
+        self._bot_io = io.StringIO()  # visible reply text, tags stripped
+        self._chunk_buf: list[str] = []
+        self._flush_scheduled = False
+        self._tag_scanner = _ActionTagScanner()
+        self._scroll_pending = False
+        self._action_future: Future | None = None
         self._intents_fired = False  # True when IntentDetector already ran actions
-        self._drag_data = {"x": 0, "y": 0}
+        self._drag_data = _DragState()
 
     def toggle(self):
         if self.is_open:
@@ -986,6 +1505,10 @@ class ChatWindow:
             return
         self.is_open = True
         self.is_streaming = False
+        # Jobs armed on the old Toplevel died with it; start the flags fresh
+        self._scroll_pending = False
+        self._flush_scheduled = False
+        self._chunk_buf.clear()
 
         self.top = tk.Toplevel(self.app.root)
         self.top.overrideredirect(True)
@@ -997,8 +1520,7 @@ class ChatWindow:
         # Position near Clippy — clamp to screen
         cx = self.app.root.winfo_x()
         cy = self.app.root.winfo_y()
-        sw = self.app.root.winfo_screenwidth()
-        sh = self.app.root.winfo_screenheight()
+        sw, sh = self.app.screen_w, self.app.screen_h
         px = cx - chat_w - 10
         if px < 0:
             px = cx + self.app.root.winfo_width() + 10
@@ -1043,20 +1565,21 @@ class ChatWindow:
         msg_container = tk.Frame(inner, bg=self.BG)
         msg_container.pack(fill="both", expand=True)
 
-        self.canvas = tk.Canvas(msg_container, bg=self.BG, highlightthickness=0, bd=0)
-        self.scrollbar = tk.Scrollbar(msg_container, orient="vertical", command=self.canvas.yview,
+        # One read-only Text holds the whole conversation; bubbles are tagged ranges
+        self.text = tk.Text(msg_container, bg=self.BG, fg=self.FG, bd=0,
+                            highlightthickness=0, wrap="word", font=("Segoe UI", 10),
+                            padx=8, pady=4, cursor="arrow", state="disabled")
+        self.scrollbar = tk.Scrollbar(msg_container, orient="vertical", command=self.text.yview,
                                       troughcolor=self.BG, width=6, bg=self.BORDER)
-        self.scrollable = tk.Frame(self.canvas, bg=self.BG)
-
-        self.scrollable.bind("<Configure>",
-                             lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.scrollable,
-                                                       anchor="nw", width=chat_w - 18)
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-        self.canvas.pack(side="left", fill="both", expand=True)
+        self.text.configure(yscrollcommand=self.scrollbar.set)
+        self.text.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
-        self.canvas.bind_all("<MouseWheel>",
-                             lambda e: self.canvas.yview_scroll(-int(e.delta / 120), "units"))
+        for kind, (bg, fg, _prefix) in self._BUBBLE_STYLE.items():
+            left, right = (80, 4) if kind == "user" else (4, 80)
+            self.text.tag_configure(kind, background=bg, foreground=fg,
+                                    lmargin1=left, lmargin2=left, rmargin=right,
+                                    spacing1=7, spacing3=7)
+        self.text.tag_configure("gap", font=("Segoe UI", 3))
 
         # ── Input area: warm bottom bar ──
         tk.Frame(inner, bg=self.ACCENT, height=2).pack(fill="x", side="bottom")
@@ -1078,7 +1601,7 @@ class ChatWindow:
         self.send_btn.pack(side="right", padx=(0, 10), pady=9)
 
         # Show greeting
-        self._add_bubble(GREETING, is_user=False)
+        self._add_bubble(GREETING, kind="bot")
         self.entry.focus_set()
 
     def close(self):
@@ -1086,10 +1609,11 @@ class ChatWindow:
             self.cancel_event.set()
         self.is_open = False
         self.is_streaming = False
-        self._bot_label = None
+        self._bot_open = False
+        if self._action_future:
+            self._action_future.cancel()  # only drops it if it hasn't started
         if self.top:
             try:
-                self.canvas.unbind_all("<MouseWheel>")
                 self.top.destroy()
             except Exception:
                 pass
@@ -1097,62 +1621,60 @@ class ChatWindow:
 
     # ── Custom title bar drag ──
     def _header_drag_start(self, event):
-        self._drag_data["x"] = event.x
-        self._drag_data["y"] = event.y
+        self._drag_data.x = event.x
+        self._drag_data.y = event.y
 
     def _header_drag_move(self, event):
         if self.top:
-            x = self.top.winfo_x() + (event.x - self._drag_data["x"])
-            y = self.top.winfo_y() + (event.y - self._drag_data["y"])
+            x = self.top.winfo_x() + (event.x - self._drag_data.x)
+            y = self.top.winfo_y() + (event.y - self._drag_data.y)
             self.top.geometry(f"+{x}+{y}")
 
-    def _add_bubble(self, text: str, is_user=False, is_error=False, is_action=False) -> tk.Label:
-        if is_action:
-            bg = self.ACTION_BG
-            fg = "#2e7d32"
-            border_col = "#a5d6a7"
-        elif is_error:
-            bg = self.ERR_BG
-            fg = "#b71c1c"
-            border_col = "#ef9a9a"
-        elif is_user:
-            bg = self.USER_BG
-            fg = self.FG
-            border_col = self.BORDER
-        else:
-            bg = self.BOT_BG
-            fg = self.FG
-            border_col = "#d4c9a8"
-
-        container = tk.Frame(self.scrollable, bg=self.BG)
-        container.pack(fill="x", padx=8, pady=4, anchor="e" if is_user else "w")
-
-        # Outer border (1px rounded feel)
-        bubble_border = tk.Frame(container, bg=border_col, bd=0)
-        pad = (80, 4) if is_user else (4, 80)
-        bubble_border.pack(fill="x", padx=pad, anchor="e" if is_user else "w")
-
-        bubble = tk.Frame(bubble_border, bg=bg, bd=0)
-        bubble.pack(fill="x", padx=1, pady=1)
-
-        # Prefix for bot/action messages
-        prefix = ""
-        if not is_user and not is_error and not is_action:
-            prefix = "📎  "
-        elif is_action:
-            prefix = "✓  "
-
-        lbl = tk.Label(bubble, text=prefix + text, bg=bg, fg=fg,
-                       font=("Segoe UI", 10), wraplength=310,
-                       justify="left", anchor="w", padx=10, pady=7)
-        lbl.pack(fill="x")
-
+    def _add_bubble(self, text: str, kind: str = "bot", mark: str | None = None):
+        """Append a message. With mark, its range is tracked by {mark}_bubble
+        (whole bubble), {mark}_start and {mark}_end (text after the prefix)."""
+        prefix = self._BUBBLE_STYLE[kind][2]
+        t = self.text
+        t.configure(state="normal")
+        if mark:
+            t.mark_set(f"{mark}_bubble", "end-1c")
+            t.mark_gravity(f"{mark}_bubble", "left")
+        t.insert("end", prefix, kind)
+        if mark:
+            t.mark_set(f"{mark}_start", "end-1c")
+            t.mark_gravity(f"{mark}_start", "left")
+        t.insert("end", text, kind)
+        if mark:
+            # Left gravity while the trailing newlines go in, then right so text
+            # later inserted at the end mark extends the range
+            t.mark_set(f"{mark}_end", "end-1c")
+            t.mark_gravity(f"{mark}_end", "left")
+        t.insert("end", "\n", kind, "\n", "gap")
+        if mark:
+            t.mark_gravity(f"{mark}_end", "right")
+        t.configure(state="disabled")
         self._scroll_bottom()
-        return lbl
+
+    def _drop_bot_reply(self):
+        """Remove the bot bubble that is being streamed into."""
+        if self._bot_open:
+            self.text.configure(state="normal")
+            self.text.delete("bot_bubble", "bot_end + 2c")
+            self.text.configure(state="disabled")
+            self._bot_open = False
 
     def _scroll_bottom(self):
-        self.canvas.update_idletasks()
-        self.canvas.yview_moveto(1.0)
+        """Scroll to the newest message on the next idle pass (coalesced)."""
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.text.after_idle(self._do_scroll_bottom)
+
+    def _do_scroll_bottom(self):
+        self._scroll_pending = False
+        try:
+            self.text.yview_moveto(1.0)
+        except Exception:
+            pass
 
     def _send(self):
         if not self.top or self.is_streaming:
@@ -1161,7 +1683,7 @@ class ChatWindow:
         if not text:
             return
         self.entry.delete(0, "end")
-        self._add_bubble(text, is_user=True)
+        self._add_bubble(text, kind="user")
 
         # ── Detect actions directly from user input (instant, no LLM needed) ──
         intents = IntentDetector.detect(text)
@@ -1172,10 +1694,14 @@ class ChatWindow:
                     result = ActionExecutor.run(cmd, arg)
                     if result and self.top:
                         self.top.after(0, lambda r=result: self._add_action_result(r))
-            threading.Thread(target=_run_intents, daemon=True).start()
+            self.app.action_pool.submit(_run_intents)
 
         # ── Still send to LLM for a friendly response ──
-        self._bot_label = self._add_bubble("", is_user=False)
+        self._add_bubble("", kind="bot", mark="bot")
+        self._bot_open = True
+        self._bot_io = io.StringIO()
+        self._chunk_buf.clear()
+        self._tag_scanner = _ActionTagScanner()
         self.is_streaming = True
         self.cancel_event.clear()
         self.send_btn.configure(text="■", bg="#c0392b", fg="#fff", command=self._cancel)
@@ -1191,14 +1717,30 @@ class ChatWindow:
         ).start()
 
     def _on_chunk(self, text: str):
-        if self.top:
-            self.top.after(0, self._append_chunk, text)
-
-    def _append_chunk(self, text: str):
-        if self._bot_label:
-            current = self._bot_label.cget("text")
-            self._bot_label.configure(text=current + text)
-            self._scroll_bottom()
+        """Queue a streamed chunk; the UI is updated at most ~30 times/s."""
+        self._chunk_buf.append(text)
+        if not self._flush_scheduled and self.top:
+            self._flush_scheduled = True
+            self.top.after(33, self._flush_chunks)
+
+    def _flush_chunks(self):
+        self._flush_scheduled = False
+        n = len(self._chunk_buf)
+        if not n:
+            return
+        text = "".join(self._chunk_buf[:n])
+        del self._chunk_buf[:n]
+        if self._bot_open:
+            text, tags = self._tag_scanner.feed(text)
+            # Execute LLM actions ONLY if IntentDetector didn't already fire
+            if tags and not self._intents_fired:
+                self._dispatch_actions(tags)
+            if text:
+                self._bot_io.write(text)
+                self.text.configure(state="normal")
+                self.text.insert("bot_end", text, "bot")
+                self.text.configure(state="disabled")
+                self._scroll_bottom()
 
     def _on_done(self):
         if self.top:
@@ -1209,9 +1751,8 @@ class ChatWindow:
             self.top.after(0, self._show_error, err)
 
     def _show_error(self, err: str):
-        if self._bot_label:
-            self._bot_label.master.destroy()
-        self._add_bubble(err, is_error=True)
+        self._drop_bot_reply()
+        self._add_bubble(err, kind="error")
         self._finish()
 
     def _on_model_not_found(self, models: list[str]):
@@ -1221,14 +1762,12 @@ class ChatWindow:
 
     def _show_model_picker(self, models: list[str]):
         """Show a standalone dialog letting the user pick from installed models."""
-        if self._bot_label:
-            self._bot_label.master.destroy()
-            self._bot_label = None
+        self._drop_bot_reply()
 
         old_model = self.app.settings.model
         self._add_bubble(
             f"🤔 Model '{old_model}' not found.\nOpening model picker...",
-            is_error=True,
+            kind="error",
         )
         self._finish()
 
@@ -1275,7 +1814,7 @@ class ChatWindow:
             self.app.settings.model = model_name
             self.app.settings.save()
             picker.destroy()
-            self._add_bubble(f"✅ Switched to {model_name}!", is_user=False)
+            self._add_bubble(f"✅ Switched to {model_name}!", kind="bot")
             self.app.speech.show(f"Now using: {model_name}", 3000)
 
         for m in models:
@@ -1293,25 +1832,32 @@ class ChatWindow:
                   cursor="hand2").pack(pady=(0, 14))
 
     def _finish_and_run_actions(self):
-        """Called when streaming completes. Parse actions from response, execute them."""
-        if self._bot_label:
-            full_text = self._bot_label.cget("text")
-            # Strip the 📎  prefix we add to bot messages
-            if full_text.startswith("📎  "):
-                full_text = full_text[3:]
-            # Strip action tags from displayed text
-            clean = re.sub(r'\[ACTION:[^\]]*\]', '', full_text).strip()
+        """Called when streaming completes. Show the reply without its action tags."""
+        self._flush_chunks()
+        if self._bot_open:
+            self._bot_io.write(self._tag_scanner.flush())
+            clean = self._bot_io.getvalue().strip()
             if clean:
-                self._bot_label.configure(text="📎  " + clean)
-            # Execute LLM actions ONLY if IntentDetector didn't already fire
-            if not self._intents_fired:
-                actions = re.findall(r'\[ACTION:([^\]]+)\]', full_text)
-                if actions:
-                    threading.Thread(
-                        target=self._execute_actions, args=(actions,), daemon=True
-                    ).start()
+                self.text.configure(state="normal")
+                self.text.delete("bot_start", "bot_end")
+                self.text.insert("bot_end", clean, "bot")
+                self.text.configure(state="disabled")
         self._finish()
 
+    def _dispatch_actions(self, actions: list[str]):
+        """Run action tags in background, after any batch still running."""
+        prev = self._action_future
+
+        def _run():
+            if prev:
+                try:
+                    prev.result()
+                except Exception:
+                    pass
+            self._execute_actions(actions)
+
+        self._action_future = self.app.action_pool.submit(_run)
+
     def _execute_actions(self, actions: list[str]):
         """Run parsed action tags in background."""
         for action_str in actions:
@@ -1327,13 +1873,13 @@ class ChatWindow:
         """Show action result with appropriate styling based on content."""
         if result.startswith(("\u274c", "\u26a0")):
             # ❌ or ⚠️ → error/warning styling
-            self._add_bubble(result, is_error=True)
+            self._add_bubble(result, kind="error")
         else:
-            self._add_bubble(result, is_action=True)
+            self._add_bubble(result, kind="action")
 
     def _finish(self):
         self.is_streaming = False
-        self._bot_label = None
+        self._bot_open = False
         self._intents_fired = False
         if self.top:
             self.send_btn.configure(text="➤", bg=self.ACCENT, fg="#fff", command=self._send)
@@ -1346,13 +1892,14 @@ class ChatWindow:
         if self.is_streaming:
             self.cancel_event.set()
         self.app.chat.clear()
-        self._bot_label = None
+        self._bot_open = False
         self.is_streaming = False
         if self.top:
             self.send_btn.configure(text="➤", bg=self.ACCENT, fg="#fff", command=self._send)
-            for w in self.scrollable.winfo_children():
-                w.destroy()
-            self._add_bubble(GREETING, is_user=False)
+            self.text.configure(state="normal")
+            self.text.delete("1.0", "end")
+            self.text.configure(state="disabled")
+            self._add_bubble(GREETING, kind="bot")
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -1455,6 +2002,55 @@ class SettingsDialog:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+# Bounce ease-out breakpoints (Penner): segment ends and segment centres
+_B1, _B2, _B3 = 1 / 2.75, 2 / 2.75, 2.5 / 2.75
+_B2C, _B3C, _B4C = 1.5 / 2.75, 2.25 / 2.75, 2.625 / 2.75
+
+
+def _ease_out_bounce(p: float) -> float:
+    if p < _B1:
+        return 7.5625 * p * p
+    elif p < _B2:
+        t = p - _B2C
+        return 7.5625 * t * t + 0.75
+    elif p < _B3:
+        t = p - _B3C
+        return 7.5625 * t * t + 0.9375
+    else:
+        t = p - _B4C
+        return 7.5625 * t * t + 0.984375
+
+
+def _ease_in_out_quint(p: float) -> float:
+    if p < 0.5:
+        return 16 * p * p * p * p * p
+    t = p - 1
+    return 1 + 16 * t * t * t * t * t
+
+
+# Easing curves sampled once; animations index them with int(p * _EASE_STEPS)
+_EASE_STEPS = 512
+_BOUNCE_LUT = tuple(_ease_out_bounce(i / _EASE_STEPS) for i in range(_EASE_STEPS + 1))
+_QUINTIC_LUT = tuple(_ease_in_out_quint(i / _EASE_STEPS) for i in range(_EASE_STEPS + 1))
+# Roam hop height in whole pixels: round(sin(p·π) · 6), same indexing
+_HOP_LUT = tuple(round(math.sin(i / _EASE_STEPS * math.pi) * 6) for i in range(_EASE_STEPS + 1))
+
+# Animation frame period. Window moves rarely land faster than ~60 Hz, so
+# ticking at 8 ms mostly produced frames with nothing new to draw.
+_FRAME_MS = 16
+
+
+class _DragState:
+    """Pointer offset where a window drag started, and whether it has moved."""
+
+    __slots__ = ("x", "y", "dragging")
+
+    def __init__(self):
+        self.x = 0
+        self.y = 0
+        self.dragging = False
+
+
 class ClippyApp:
     # Clippy states
     STATE_IDLE = "idle"
@@ -1472,6 +2068,12 @@ class ClippyApp:
         self.root.attributes("-topmost", self.settings.always_on_top)
         self.root.configure(bg="#f0f0f0")
         self.root.attributes("-transparentcolor", "#f0f0f0")
+        # Raw Tcl entry point for per-frame window moves (see _move)
+        self._tkcall = self.root.tk.call
+        self._wname = self.root._w
+        # Primary screen size, read once rather than on every reposition
+        self.screen_w = self.root.winfo_screenwidth()
+        self.screen_h = self.root.winfo_screenheight()
 
         # ── Load sprites ──
         self.sprites: dict[str, AnimatedSprite] = {}
@@ -1487,13 +2089,21 @@ class ClippyApp:
         self.clippy_label.bind("<ButtonPress-1>", self._drag_start)
         self.clippy_label.bind("<B1-Motion>", self._drag_move)
         self.clippy_label.bind("<ButtonRelease-1>", self._drag_end)
+        # Pause sprite animation while the window is unmapped (minimized/withdrawn)
+        self._viewable = True
+        self.root.bind("<Map>", self._on_map)
+        self.root.bind("<Unmap>", self._on_unmap)
 
         # ── State ──
         self.state = self.STATE_IDLE
         self._anim_job = None
-        self._drag_data = {"x": 0, "y": 0, "dragging": False}
+        self._drag_data = _DragState()
+        self._geom_x = self._geom_y = 0  # last position passed to _move()
 
-        # ── Chat window ──
+        # ── Chat window (actions run on a shared worker pool) ──
+        self.action_pool = _DaemonPool(max_workers=2, thread_name_prefix="clippy-act")
+        # Ollama start/restart work
+        self._pool = _DaemonPool(max_workers=2, thread_name_prefix="clippy-bg")
         self.chat_window = ChatWindow(self)
         self.chat = self.chat_service
 
@@ -1509,14 +2119,16 @@ class ClippyApp:
         self.menu.add_command(label="📋  Available Models", command=self._show_models)
         self.menu.add_separator()
         self.menu.add_command(label="🔄  Restart Ollama", command=self._restart_ollama)
-        self.menu.add_command(label="🌐  Ollama Website", command=lambda: webbrowser.open("https://ollama.com"))
+        self.menu.add_command(label="🌐  Ollama Website", command=lambda: ActionExecutor.run("OPEN_URL", "https://ollama.com"))
         self.menu.add_separator()
         self.menu.add_command(label="❌  Exit Clippy", command=self._quit)
 
         # ── Idle behaviors ──
+        self._rng = random.Random()  # own generator; seed it for repeatable runs
         self._roam_target = None
-        self._roam_job = None
-        self._tip_job = None
+        # Named one-shot timers sharing a single after() job armed for the earliest
+        self._timers = {}   # name → (time.monotonic() due, callback)
+        self._timer_job = None
         self._wave_timeout = None
 
         # ── Auto-start Ollama ──
@@ -1537,11 +2149,9 @@ class ClippyApp:
 
         if self._saved_pos is None:
             # Default: bottom-right of primary monitor
-            sw = self.root.winfo_screenwidth()
-            sh = self.root.winfo_screenheight()
-            self._saved_pos = (sw - 140, sh - 160)
+            self._saved_pos = (self.screen_w - 140, self.screen_h - 160)
 
-        self.root.geometry(f"+{self._saved_pos[0]}+{self._saved_pos[1]}")
+        self._move(*self._saved_pos)
         self.root.deiconify()
 
         # Start!
@@ -1561,18 +2171,12 @@ class ClippyApp:
 
         # If no idle sprite, create placeholder
         if "idle" not in self.sprites:
+            from PIL import ImageDraw
             img = Image.new("RGBA", (90, 90), (0, 0, 0, 0))
             draw = ImageDraw.Draw(img)
             draw.rounded_rectangle([6, 6, 84, 84], radius=12, fill=(80, 80, 80, 200))
             draw.text((30, 30), "📎", fill="white")
-            photo = ImageTk.PhotoImage(img)
-            # Fake sprite
-            s = AnimatedSprite.__new__(AnimatedSprite)
-            s.frames = [photo]
-            s.durations = [100]
-            s.current = 0
-            s.size = (90, 90)
-            self.sprites["idle"] = s
+            self.sprites["idle"] = AnimatedSprite.from_static(ImageTk.PhotoImage(img), (90, 90))
 
     def set_state(self, state: str):
         """Switch Clippy's animation state."""
@@ -1597,16 +2201,31 @@ class ClippyApp:
         self.clippy_label.configure(image=frame)
         self.clippy_label.image = frame  # keep ref
 
-        if sprite.is_animated:
+        if sprite.is_animated and self._viewable:
             self._anim_job = self.root.after(dur, self._animate)
 
+    def _on_map(self, event):
+        if event.widget is self.root and not self._viewable:
+            self._viewable = True
+            self._animate()  # resume
+
+    def _on_unmap(self, event):
+        if event.widget is self.root:
+            self._viewable = False
+
     # ── Intro Animation ──
 
+    def _move(self, x: int, y: int):
+        """Move Clippy's window, remembering where it was put."""
+        self._tkcall("wm", "geometry", self._wname, f"+{x}+{y}")
+        self._geom_x = x
+        self._geom_y = y
+
     def _save_position(self):
         """Persist Clippy's current screen position to settings."""
         try:
-            self.settings.pos_x = self.root.winfo_x()
-            self.settings.pos_y = self.root.winfo_y()
+            self.settings.pos_x = self._geom_x
+            self.settings.pos_y = self._geom_y
             self.settings.save()
         except Exception:
             pass
@@ -1620,36 +2239,34 @@ class ClippyApp:
         self.set_state("idle")
 
         duration = 800
-        start_t = time.perf_counter()
+        # Per-frame names bound once (locals are cheaper than attribute/global lookups)
+        perf, move, tkcall, lut = time.perf_counter, self._move, self._tkcall, _BOUNCE_LUT
+        floor = math.floor
+        start_t = perf()
         last_y = [None]
 
         def _step():
-            elapsed = (time.perf_counter() - start_t) * 1000
+            now = perf()
+            elapsed = (now - start_t) * 1000
             p = min(elapsed / duration, 1.0)
+            ease = lut[int(p * _EASE_STEPS)]  # bounce ease-out
 
-            # Bounce ease-out
-            if p < 1 / 2.75:
-                ease = 7.5625 * p * p
-            elif p < 2 / 2.75:
-                t = p - 1.5 / 2.75
-                ease = 7.5625 * t * t + 0.75
-            elif p < 2.5 / 2.75:
-                t = p - 2.25 / 2.75
-                ease = 7.5625 * t * t + 0.9375
-            else:
-                t = p - 2.625 / 2.75
-                ease = 7.5625 * t * t + 0.984375
-
-            y = round(start_y + (target_y - start_y) * ease)
+            # Round half up; floor (not int) because coordinates can be negative
+            y = floor(start_y + (target_y - start_y) * ease + 0.5)
             if y != last_y[0]:
-                self.root.geometry(f"+{target_x}+{y}")
+                move(target_x, y)
                 last_y[0] = y
 
             if p < 1.0:
-                self.root.after(8, _step)
+                # Next frame one period after this one started, minus the time spent here
+                spent = int((perf() - now) * 1000)
+                tkcall("after", max(1, _FRAME_MS - spent), step_cmd)
             else:
+                self.root.deletecommand(step_cmd)
                 self.root.after(400, self._post_intro)
 
+        # One Tcl command for the whole animation instead of a new one per after()
+        step_cmd = self.root.register(_step)
         _step()
 
     def _post_intro(self):
@@ -1659,15 +2276,43 @@ class ClippyApp:
         # Start the thinking animation briefly as a wave
         if "thinking" in self.sprites:
             self.set_state("thinking")
-            self.root.after(2500, lambda: self.set_state("idle"))
+            self._set_timer("wave", 2500, lambda: self.set_state("idle"))
 
         # Auto-start Ollama in background
         if self.settings.auto_start_ollama:
-            threading.Thread(target=self._bg_start_ollama, daemon=True).start()
-
-        # Start idle behaviors
-        self.root.after(8000, self._schedule_tip)
-        self.root.after(12000, self._schedule_roam)
+            self._pool.submit(self._bg_start_ollama)
+
+        # Start idle behaviors at 8s and 12s
+        self._set_timer("tip", 8000, self._schedule_tip)
+        self._set_timer("roam", 12000, self._schedule_roam)
+
+    def _set_timer(self, name: str, delay_ms: int, fn):
+        """Run fn after delay_ms, replacing any pending timer with the same name."""
+        self._timers[name] = (time.monotonic() + delay_ms / 1000, fn)
+        self._arm_timers()
+
+    def _arm_timers(self):
+        """Point the single after() job at the earliest pending timer."""
+        if self._timer_job is not None:
+            self.root.after_cancel(self._timer_job)
+            self._timer_job = None
+        if self._timers:
+            due = min(t for t, _ in self._timers.values())
+            delay = max(0, math.ceil((due - time.monotonic()) * 1000))
+            self._timer_job = self.root.after(delay, self._run_timers)
+
+    def _run_timers(self):
+        """Fire every timer that is due, then re-arm for the next one."""
+        self._timer_job = None
+        now = time.monotonic()
+        try:
+            for name in [n for n, (t, _) in self._timers.items() if t <= now]:
+                t, fn = self._timers[name]
+                if t <= now:   # an earlier callback may have re-set it
+                    del self._timers[name]
+                    fn()
+        finally:
+            self._arm_timers()
 
     def _bg_start_ollama(self):
         err = OllamaManager.auto_start(self.settings.ollama_url)
@@ -1681,95 +2326,93 @@ class ClippyApp:
 
     def _schedule_roam(self):
         if not self.settings.idle_roaming:
-            self._roam_job = self.root.after(10000, self._schedule_roam)
+            self._set_timer("roam", 10000, self._schedule_roam)
             return
-        if self.chat_window.is_open or self._drag_data["dragging"]:
-            self._roam_job = self.root.after(5000, self._schedule_roam)
+        if self.chat_window.is_open or self._drag_data.dragging:
+            self._set_timer("roam", 5000, self._schedule_roam)
             return
 
-        delay = random.randint(15000, 35000)
-        self._roam_job = self.root.after(delay, self._do_roam)
+        delay = self._rng.randint(15000, 35000)
+        self._set_timer("roam", delay, self._do_roam)
 
     def _do_roam(self):
         """Pick a random nearby spot and walk there."""
-        if self.chat_window.is_open or self._drag_data["dragging"]:
+        if self.chat_window.is_open or self._drag_data.dragging:
             self._schedule_roam()
             return
 
         # Use virtual screen bounds so Clippy can roam on any monitor
         vl, vt, vr, vb = _get_virtual_screen_bounds()
-        cx = self.root.winfo_x()
-        cy = self.root.winfo_y()
+        cx, cy = self._geom_x, self._geom_y
 
         # Random target within ±200px, clamped to virtual desktop
-        tx = max(vl + 20, min(vr - 110, cx + random.randint(-200, 200)))
-        ty = max(vt + 20, min(vb - 140, cy + random.randint(-150, 150)))
+        tx = max(vl + 20, min(vr - 110, cx + self._rng.randint(-200, 200)))
+        ty = max(vt + 20, min(vb - 140, cy + self._rng.randint(-150, 150)))
 
         self._roam_to(cx, cy, tx, ty)
 
     def _roam_to(self, sx, sy, tx, ty):
-        """Smoothly move Clippy from (sx,sy) to (tx,ty) using sub-pixel interpolation."""
+        """Smoothly move Clippy from (sx,sy) to (tx,ty) along a precomputed eased path."""
         dist = math.sqrt((tx - sx) ** 2 + (ty - sy) ** 2)
         duration = max(1500, int(dist * 8))  # slower movement
-        start_t = time.perf_counter()
+
+        # One (x, y) per frame: quintic ease in-out plus a gentle hop
+        n = max(1, duration // _FRAME_MS)
+        path = []
+        for i in range(n + 1):
+            k = i * _EASE_STEPS // n
+            ease = _QUINTIC_LUT[k]
+            path.append((math.floor(sx + (tx - sx) * ease + 0.5),
+                         math.floor(sy + (ty - sy) * ease + 0.5) - _HOP_LUT[k]))
+
+        frame = [0]
         # Track last rendered position to skip no-op geometry calls
-        last_pos = [None, None]
+        last_pos = [None]
+        drag, move, tkcall = self._drag_data, self._move, self._tkcall
 
         def _step():
-            if self._drag_data["dragging"]:
+            if drag.dragging:
+                self.root.deletecommand(step_cmd)
                 self._save_position()
                 self._schedule_roam()
                 return
-            now = time.perf_counter()
-            elapsed = (now - start_t) * 1000
-            p = min(elapsed / duration, 1.0)
-
-            # Smoother quintic ease in-out
-            if p < 0.5:
-                ease = 16 * p * p * p * p * p
-            else:
-                t = p - 1
-                ease = 1 + 16 * t * t * t * t * t
-
-            x = round(sx + (tx - sx) * ease)
-            y = round(sy + (ty - sy) * ease)
-
-            # Gentle hop/wobble
-            hop = round(math.sin(p * math.pi) * 6)
-            fy = y - hop
+            i = frame[0]
+            pos = path[i]
 
             # Only update geometry when position actually changes
-            if x != last_pos[0] or fy != last_pos[1]:
-                self.root.geometry(f"+{x}+{fy}")
-                last_pos[0] = x
-                last_pos[1] = fy
+            if pos != last_pos[0]:
+                move(*pos)
+                last_pos[0] = pos
 
-            if p < 1.0:
-                self.root.after(8, _step)  # ~120fps target for smoother interpolation
+            if i < n:
+                frame[0] = i + 1
+                tkcall("after", _FRAME_MS, step_cmd)
             else:
+                self.root.deletecommand(step_cmd)
                 self._save_position()
                 self._schedule_roam()
 
+        step_cmd = self.root.register(_step)
         _step()
 
     # ── Idle Tips ──
 
     def _schedule_tip(self):
         if not self.settings.show_tips:
-            self._tip_job = self.root.after(15000, self._schedule_tip)
+            self._set_timer("tip", 15000, self._schedule_tip)
             return
         if self.chat_window.is_open:
-            self._tip_job = self.root.after(10000, self._schedule_tip)
+            self._set_timer("tip", 10000, self._schedule_tip)
             return
 
-        delay = random.randint(25000, 60000)
-        self._tip_job = self.root.after(delay, self._show_tip)
+        delay = self._rng.randint(25000, 60000)
+        self._set_timer("tip", delay, self._show_tip)
 
     def _show_tip(self):
         if self.chat_window.is_open:
             self._schedule_tip()
             return
-        tip = random.choice(IDLE_TIPS)
+        tip = self._rng.choice(IDLE_TIPS)
         self.speech.show(tip, 5000)
 
         # Play thinking animation during tip
@@ -1782,18 +2425,18 @@ class ClippyApp:
     # ── Drag ──
 
     def _drag_start(self, event):
-        self._drag_data["x"] = event.x
-        self._drag_data["y"] = event.y
-        self._drag_data["dragging"] = False
+        self._drag_data.x = event.x
+        self._drag_data.y = event.y
+        self._drag_data.dragging = False
 
     def _drag_move(self, event):
-        self._drag_data["dragging"] = True
-        x = self.root.winfo_x() + (event.x - self._drag_data["x"])
-        y = self.root.winfo_y() + (event.y - self._drag_data["y"])
-        self.root.geometry(f"+{x}+{y}")
+        self._drag_data.dragging = True
+        x = self._geom_x + (event.x - self._drag_data.x)
+        y = self._geom_y + (event.y - self._drag_data.y)
+        self._move(x, y)
 
     def _drag_end(self, event):
-        self._drag_data["dragging"] = False
+        self._drag_data.dragging = False
         self._save_position()
 
     # ── Context menu ──
@@ -1826,11 +2469,12 @@ class ClippyApp:
                 time.sleep(2)
             except Exception:
                 pass
+            OllamaManager.invalidate()
             err = OllamaManager.auto_start(self.settings.ollama_url)
             msg = err if err else "✅ Ollama restarted!"
             self.root.after(0, lambda: self.speech.show(msg, 4000))
 
-        threading.Thread(target=_do, daemon=True).start()
+        self._pool.submit(_do)
 
     def open_settings(self):
         SettingsDialog(self.root, self.settings)
@@ -1842,6 +2486,8 @@ class ClippyApp:
         self.speech.hide()
         if self.chat_window.is_open:
             self.chat_window.close()
+        self.action_pool.shutdown(cancel_futures=True)
+        self._pool.shutdown(cancel_futures=True)
         self.root.destroy()
 
     def run(self):